@@ -10,8 +10,10 @@ from flask_cors import CORS
 from flask_smorest import Api
 from database.db_setup import init_db
 from routes import register_routes
+from utils.json_provider import OrjsonProvider
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, resources={r"/*": {"origins": "*"}}, supports_credentials=True)
 app.config['API_TITLE'] = 'Barber System'
 app.config['API_VERSION'] = '1.0'
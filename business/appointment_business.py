@@ -4,11 +4,11 @@ Business module for Appointment entities.
 
 from datetime import datetime
 from typing import List
+from sqlalchemy.exc import IntegrityError
 from business.base import get_or_404
 from database.models.appointment import Appointment
 from repositories.appointment_repository import add_appointment, delete_appointment, \
     get_appointment, update_appointment
-from repositories.service_repository import get_service
 from validations.appointment_validation import AppointmentValidation
 
 
@@ -27,17 +27,19 @@ def create_appointment(date: str, customer_id: int,
         Appointment: Created appointment.
 
     Raises:
-        HTTPException: If validation fails.
+        HTTPException: If validation fails, or the slot was booked concurrently (409).
     """
 
     date = datetime.strptime(date, '%Y-%m-%d %H:%M:%S')
 
-    AppointmentValidation.validate_appointment(date,
-                                               customer_id, employee_id, services_ids)
+    validated = AppointmentValidation.validate_appointment(date,
+                                                           customer_id, employee_id, services_ids)
 
-    services = [get_service(service_id) for service_id in services_ids]
-
-    return add_appointment(date, customer_id, employee_id, services)
+    try:
+        return add_appointment(date, customer_id, employee_id, validated.services)
+    except IntegrityError:
+        AppointmentValidation.validate_date_available(date, employee_id, customer_id)
+        raise
 
 
 def delete_appointment_by_id(appointment_id: int) -> bool:
@@ -71,16 +73,31 @@ def update_appointment_by_id(appointment_id: int, **fields) -> Appointment:
         Appointment: The updated appointment.
 
     Raises:
-        HTTPException: If appointment not found (404) or validation fails.
+        HTTPException: If appointment not found (404), validation fails, or the slot
+            was booked concurrently (409).
     """
     appointment = get_or_404(get_appointment, appointment_id, 'appointment')
 
+    current_services_ids = [service.id for service in appointment.services] \
+        if 'services_ids' in fields else None
+
     validated = AppointmentValidation.validate_appointment_update(
         fields,
         current_customer_id=appointment.customer_id,
         current_employee_id=appointment.employee_id,
         current_date=appointment.date,
-        appointment_id=appointment_id
+        appointment_id=appointment_id,
+        current_services_ids=current_services_ids
     )
 
-    return update_appointment(appointment, **validated)
+    date = validated.get('date', appointment.date)
+    employee_id = validated['employee'].id if 'employee' in validated \
+        else appointment.employee_id
+    customer_id = appointment.customer_id
+
+    try:
+        return update_appointment(appointment, **validated)
+    except IntegrityError:
+        AppointmentValidation.validate_date_available(
+            date, employee_id, customer_id, appointment_id)
+        raise
@@ -7,7 +7,6 @@ from business.base import get_or_404
 from database.models.employee import Employee
 from repositories.employee_repository import add_employee, delete_employee, get_employee, \
     update_employee
-from repositories.service_repository import get_services_by_services_ids
 from validations.employee_validation import EmployeeValidation
 
 
@@ -29,9 +28,7 @@ def create_employee(name: str, email: str, phone_number: str, service_ids: List[
         HTTPException: If validation fails.
     """
 
-    EmployeeValidation.validate_employee(email, service_ids, phone_number)
-
-    services = get_services_by_services_ids(service_ids)
+    services = EmployeeValidation.validate_employee(email, service_ids, phone_number)
 
     return add_employee(name, email, phone_number, services, status)
 
@@ -73,6 +70,6 @@ def update_employee_by_id(employee_id: int, **fields) -> Employee:
     employee = get_or_404(get_employee, employee_id, 'employee')
 
     validated = EmployeeValidation.validate_employee_update(
-        fields, current_employee_id=employee_id)
+        fields, current_employee_id=employee_id, current_employee=employee)
 
     return update_employee(employee, **validated)
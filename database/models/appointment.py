@@ -27,6 +27,10 @@ class Appointment(db.Model):
     """
 
     __tablename__ = 'appointment'
+    __table_args__ = (
+        db.UniqueConstraint('customer_id', 'date', name='uq_appointment_customer_id_date'),
+        db.UniqueConstraint('employee_id', 'date', name='uq_appointment_employee_id_date'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.DateTime, nullable=False)
@@ -4,13 +4,16 @@ Repository module for Appointment queries.
 
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
+from sqlalchemy import Row, exists, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from database.db_setup import db
 from database.models.appointment import Appointment
+from database.models.customer import Customer
+from database.models.employee import Employee
+from utils.request_cache import request_now
 
 if TYPE_CHECKING:
-    from ..database.models.appointment import Appointment
-    from ..database.models.service import Service
+    from database.models.service import Service
 
 
 def get_all_appointments() -> List[Appointment]:
@@ -39,9 +42,9 @@ def get_appointments_count(period: Optional[str] = None) -> int:
     query = db.session.query(Appointment)
 
     if period == 'past':
-        query = query.filter(Appointment.date < datetime.now())
+        query = query.filter(Appointment.date < request_now())
     elif period == 'upcoming':
-        query = query.filter(Appointment.date >= datetime.now())
+        query = query.filter(Appointment.date >= request_now())
 
     return query.count()
 
@@ -60,60 +63,62 @@ def get_appointment(appointment_id: int) -> Optional[Appointment]:
     return db.session.query(Appointment).filter_by(id=appointment_id).first()
 
 
-def get_customer_appointment(
-    date: datetime,
-    customer_id: int,
-    exclude_appointment_id: Optional[int] = None,
-) -> Optional[Appointment]:
+def get_conflicting_appointments(
+        date: datetime,
+        customer_id: int,
+        employee_id: int,
+        exclude_appointment_id: Optional[int] = None,
+) -> List[Appointment]:
     """
-    Retrieves a customer appointment by date.
+    Retrieves appointments at the given date booked by the customer or the employee.
 
     Args:
         date (datetime): The appointment date.
         customer_id (int): The customer's ID.
+        employee_id (int): The employee's ID.
         exclude_appointment_id (Optional[int]): Appointment ID to exclude from the search.
 
     Returns:
-         Optional[Appointment]: The appointment found or None.
+        List[Appointment]: Up to two conflicting appointments.
     """
 
     query = db.session.query(Appointment).filter(
-        Appointment.customer_id == customer_id,
-        Appointment.date == date
+        Appointment.date == date,
+        or_(Appointment.customer_id == customer_id,
+            Appointment.employee_id == employee_id)
     )
 
     if exclude_appointment_id is not None:
         query = query.filter(Appointment.id != exclude_appointment_id)
 
-    return query.first()
+    return query.limit(2).all()
 
 
-def get_employee_appointment(
-        date: datetime,
-        employee_id: int,
-        exclude_appointment_id: Optional[int] = None,
-) -> Optional[Appointment]:
+def get_appointment_preflight(date: datetime, customer_id: int, employee_id: int) -> Row:
     """
-    Retrieves an employee appointment by date.
+    Checks in a single query whether a new appointment's customer and employee
+    exist and whether either is already booked at the given date.
 
     Args:
         date (datetime): The appointment date.
+        customer_id (int): The customer's ID.
         employee_id (int): The employee's ID.
-        exclude_appointment_id (Optional[int]): Appointment ID to exclude from the search.
 
     Returns:
-         Optional[Appointment]: The appointment found or None.
+        Row: Flags named customer_exists, employee_exists, customer_conflict
+            and employee_conflict.
     """
 
-    query = db.session.query(Appointment).filter(
-        Appointment.employee_id == employee_id,
-        Appointment.date == date
+    statement = select(
+        exists().where(Customer.id == customer_id).label('customer_exists'),
+        exists().where(Employee.id == employee_id).label('employee_exists'),
+        exists().where(Appointment.date == date,
+                       Appointment.customer_id == customer_id).label('customer_conflict'),
+        exists().where(Appointment.date == date,
+                       Appointment.employee_id == employee_id).label('employee_conflict'),
     )
 
-    if exclude_appointment_id is not None:
-        query = query.filter(Appointment.id != exclude_appointment_id)
-
-    return query.first()
+    return db.session.execute(statement).one()
 
 
 def delete_appointment(appointment: Appointment) -> bool:
@@ -22,32 +22,32 @@ def get_customer(customer_id: int) -> Optional[Customer]:
     return db.session.query(Customer).filter_by(id=customer_id).first()
 
 
-def search_customer_by_email(email: str) -> Optional[Customer]:
+def get_customer_id_by_email(email: str) -> Optional[int]:
     """
-    Retrieves a customer by email.
+    Retrieves the ID of the customer with the given email.
 
     Args:
         email (str): The customer's email to search.
 
     Returns:
-        Optional[Customer] | None: The matching customer or None.
+        Optional[int]: The matching customer's ID or None.
     """
 
-    return db.session.query(Customer).filter_by(email=email).first()
+    return db.session.query(Customer.id).filter_by(email=email).scalar()
 
 
-def search_customer_by_phone_number(phone_number: str) -> Optional[Customer]:
+def get_customer_id_by_phone_number(phone_number: str) -> Optional[int]:
     """
-    Retrieves a customer by phone number.
+    Retrieves the ID of the customer with the given phone number.
 
     Args:
         phone_number (str): The customer's phone number to search.
 
     Returns:
-        Optional[Customer] | None: The matching customer or None.
+        Optional[int]: The matching customer's ID or None.
     """
 
-    return db.session.query(Customer).filter_by(phone_number=phone_number).first()
+    return db.session.query(Customer.id).filter_by(phone_number=phone_number).scalar()
 
 
 def get_all_customers() -> List[Customer]:
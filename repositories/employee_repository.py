@@ -2,13 +2,39 @@
 Repository module for Employee queries.
 """
 
-from typing import List, Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import List, Optional
+from sqlalchemy import Row, or_
 from sqlalchemy.exc import SQLAlchemyError
 from database.models.employee import Employee
+from database.models.service import Service
 from database.db_setup import db
+from repositories.service_repository import any_service_exists
+from utils.lookup_cache import LookupCache
 
-if TYPE_CHECKING:
-    from ..database.models.service import Service
+LOOKUP_CACHE_MAX_SIZE = 10000
+LOOKUP_CACHE_TTL = 60
+
+_email_cache = LookupCache(maxsize=LOOKUP_CACHE_MAX_SIZE, ttl=LOOKUP_CACHE_TTL)
+_phone_number_cache = LookupCache(maxsize=LOOKUP_CACHE_MAX_SIZE, ttl=LOOKUP_CACHE_TTL)
+
+
+@dataclass(slots=True, frozen=True)
+class EmployeePreflight:
+    """
+    Lookups needed to validate a new employee.
+
+    Attributes:
+        email_taken (bool): Whether the email is already registered.
+        phone_number_taken (bool): Whether the phone number is already registered.
+        has_services (bool): Whether any service is registered.
+        services (List[Service]): The registered services among the requested IDs.
+    """
+
+    email_taken: bool
+    phone_number_taken: bool
+    has_services: bool
+    services: List[Service]
 
 
 def get_employee(employee_id: int) -> Optional[Employee]:
@@ -25,32 +51,106 @@ def get_employee(employee_id: int) -> Optional[Employee]:
     return db.session.query(Employee).filter_by(id=employee_id).first()
 
 
-def search_employee_email(email: str) -> Optional[Employee]:
+def get_employee_id_by_email(email: str) -> Optional[int]:
     """
-    Retrieves an employee by email.
+    Retrieves the ID of the employee with the given email.
+
+    Results are cached per process and invalidated when employees are
+    added, updated or deleted.
 
     Args:
         email (str): The employee email to search.
 
     Returns:
-        Optional[Employee] | None: The employee found or None.
+        Optional[int]: The employee's ID or None.
     """
 
-    return db.session.query(Employee).filter_by(email=email).first()
+    return _email_cache.get(
+        email, lambda key: db.session.query(Employee.id).filter_by(email=key).scalar())
 
 
-def search_employee_by_phone_number(phone_number: str) -> Optional[Employee]:
+def get_employee_id_by_phone_number(phone_number: str) -> Optional[int]:
     """
-    Retrieves a employee by phone number.
+    Retrieves the ID of the employee with the given phone number.
+
+    Results are cached per process and invalidated when employees are
+    added, updated or deleted.
 
     Args:
         phone_number (str): The employee's phone number to search.
 
     Returns:
-        Optional[Employee] | None: The matching employee or None.
+        Optional[int]: The employee's ID or None.
+    """
+
+    return _phone_number_cache.get(
+        phone_number,
+        lambda key: db.session.query(Employee.id).filter_by(phone_number=key).scalar())
+
+
+def search_employee_ids_by_email_or_phone_number(
+        email: str,
+        phone_number: str,
+) -> List[Row]:
+    """
+    Retrieves the employees matching the given email or phone number in one query.
+
+    Args:
+        email (str): The employee email to search.
+        phone_number (str): The employee's phone number to search.
+
+    Returns:
+        List[Row]: At most two rows with the `id`, `email` and `phone_number` columns.
     """
 
-    return db.session.query(Employee).filter_by(phone_number=phone_number).first()
+    return db.session.query(Employee.id, Employee.email, Employee.phone_number).filter(
+        or_(Employee.email == email, Employee.phone_number == phone_number)
+    ).all()
+
+
+def _invalidate_lookups(emails: List[str], phone_numbers: List[str]) -> None:
+    """
+    Drops cached email and phone number lookups.
+
+    Args:
+        emails (List[str]): Emails whose lookups may have changed.
+        phone_numbers (List[str]): Phone numbers whose lookups may have changed.
+    """
+
+    _email_cache.invalidate_many(emails)
+    _phone_number_cache.invalidate_many(phone_numbers)
+
+
+def preflight_employee_validation(
+        email: str,
+        phone_number: str,
+        service_ids: List[int],
+) -> EmployeePreflight:
+    """
+    Runs the lookups needed to validate a new employee.
+
+    Args:
+        email (str): The employee's email.
+        phone_number (str): The employee's phone number.
+        service_ids (List[int]): The IDs of the services to associate.
+
+    Returns:
+        EmployeePreflight: The uniqueness flags and the matching services.
+    """
+
+    employees = db.session.query(Employee.email, Employee.phone_number).filter(
+        or_(Employee.email == email, Employee.phone_number == phone_number)
+    ).all()
+    services = db.session.query(Service).filter(Service.id.in_(service_ids)).all()
+    has_services = bool(services) or any_service_exists()
+
+    return EmployeePreflight(
+        email_taken=any(employee.email == email for employee in employees),
+        phone_number_taken=any(
+            employee.phone_number == phone_number for employee in employees),
+        has_services=has_services,
+        services=services,
+    )
 
 
 def get_all_employees(status: Optional[str] = None) -> List[Employee]:
@@ -105,9 +205,12 @@ def delete_employee(employee: Employee) -> bool:
         SQLAlchemyError: If the deletion fails.
     """
 
+    email, phone_number = employee.email, employee.phone_number
+
     try:
         db.session.delete(employee)
         db.session.commit()
+        _invalidate_lookups([email], [phone_number])
 
         return True
     except SQLAlchemyError as error:
@@ -144,6 +247,7 @@ def add_employee(
                             services, appointments=[], status=status)
         db.session.add(employee)
         db.session.commit()
+        _invalidate_lookups([email], [phone_number])
 
         return employee
     except SQLAlchemyError as error:
@@ -166,6 +270,8 @@ def update_employee(employee: Employee, **fields) -> Employee:
         SQLAlchemyError: If the update fails.
     """
 
+    previous_email, previous_phone_number = employee.email, employee.phone_number
+
     try:
         for key, value in fields.items():
             if hasattr(employee, key) and value is not None:
@@ -173,6 +279,8 @@ def update_employee(employee: Employee, **fields) -> Employee:
 
         db.session.add(employee)
         db.session.commit()
+        _invalidate_lookups([previous_email, employee.email],
+                            [previous_phone_number, employee.phone_number])
 
         return employee
     except SQLAlchemyError as error:
@@ -6,6 +6,12 @@ from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from database.models.service import Service
 from database.db_setup import db
+from utils.lookup_cache import LookupCache
+
+LOOKUP_CACHE_MAX_SIZE = 10000
+LOOKUP_CACHE_TTL = 60
+
+_name_cache = LookupCache(maxsize=LOOKUP_CACHE_MAX_SIZE, ttl=LOOKUP_CACHE_TTL)
 
 
 def get_all_services(status: Optional[str] = None) -> List[Service]:
@@ -62,6 +68,17 @@ def get_services_count(status: Optional[str] = None) -> int:
     return query.count()
 
 
+def any_service_exists() -> bool:
+    """
+    Checks whether at least one service is registered.
+
+    Returns:
+        bool: True if any service exists.
+    """
+
+    return db.session.query(db.session.query(Service.id).exists()).scalar()
+
+
 def get_service(service_id: int) -> Optional[Service]:
     """
     Retrieves a service by its ID.
@@ -76,18 +93,22 @@ def get_service(service_id: int) -> Optional[Service]:
     return db.session.query(Service).filter_by(id=service_id).first()
 
 
-def get_service_by_name(name: str) -> Optional[Service]:
+def get_service_id_by_name(name: str) -> Optional[int]:
     """
-    Retrieves a service by its name.
+    Retrieves the ID of the service with the given name.
+
+    Results are cached per process and invalidated when services are
+    added, updated or deleted.
 
     Args:
         name (str): The service name.
 
     Returns:
-        Optional[Service] | None: The service found or None.
+        Optional[int]: The service's ID or None.
     """
 
-    return db.session.query(Service).filter_by(name=name).first()
+    return _name_cache.get(
+        name, lambda key: db.session.query(Service.id).filter_by(name=key).limit(1).scalar())
 
 
 def delete_service(service: Service) -> bool:
@@ -104,9 +125,12 @@ def delete_service(service: Service) -> bool:
         SQLAlchemyError: If the deletion fails.
     """
 
+    name = service.name
+
     try:
         db.session.delete(service)
         db.session.commit()
+        _name_cache.invalidate(name)
 
         return True
     except SQLAlchemyError as error:
@@ -135,6 +159,7 @@ def add_service(name: str, price: int, status: str = 'available') -> Service:
                           employees=[], appointments=[])
         db.session.add(service)
         db.session.commit()
+        _name_cache.invalidate(name)
 
         return service
     except SQLAlchemyError as error:
@@ -157,6 +182,8 @@ def update_service(service: Service, **fields) -> Service:
         SQLAlchemyError: If the update fails.
     """
 
+    previous_name = service.name
+
     try:
         for key, value in fields.items():
             if hasattr(service, key) and value is not None:
@@ -164,6 +191,7 @@ def update_service(service: Service, **fields) -> Service:
 
         db.session.add(service)
         db.session.commit()
+        _name_cache.invalidate_many((previous_name, service.name))
 
         return service
     except SQLAlchemyError as error:
@@ -3,6 +3,7 @@ Schema module for Employee entities.
 """
 
 from marshmallow import Schema, fields, validate
+from schemas.validators import FrozenOneOf
 
 NAME_METADATA = {
     'example': 'Fulano de Tal'}
@@ -43,7 +44,7 @@ class EmployeeSchema(Schema):
         required=False,
         metadata=STATUS_METADATA,
         description=STATUS_DESCRIPTION,
-        validate=validate.OneOf(
+        validate=FrozenOneOf(
             ['available', 'vacation', 'sick_leave', 'unavailable']),
         load_default='available'
     )
@@ -3,6 +3,7 @@ Schema module for Service entities.
 """
 
 from marshmallow import Schema, fields, validate
+from schemas.validators import FrozenOneOf
 
 NAME_METADATA = {
     'example': 'Corte de Cabelo Masculino'}
@@ -13,6 +14,9 @@ PRICE_DESCRIPTION = 'Preço do Serviço em centavos (4500 é equivalente $45,00)
 STATUS_METADATA = {
     'example': 'available'}
 STATUS_DESCRIPTION = 'Status do Serviço (Disponível ou Indisponível)'
+ID_LIST_METADATA = {'example': '[1]'}
+EMPLOYEES_DESCRIPTION = 'Lista dos funcionários que executam o serviço'
+APPOINTMENTS_DESCRIPTION = 'Lista dos agendamentos que possuem o serviço'
 
 
 class ServiceSchema(Schema):
@@ -31,7 +35,7 @@ class ServiceSchema(Schema):
         required=True, metadata=PRICE_METADATA, description=PRICE_DESCRIPTION)
     status = fields.Str(
         required=False, metadata=STATUS_METADATA, description=STATUS_DESCRIPTION,
-        validate=validate.OneOf(['available', 'unavailable']),
+        validate=FrozenOneOf(['available', 'unavailable']),
         load_default='available')
 
 
@@ -58,12 +62,12 @@ class ServiceViewSchema(Schema):
     employees = fields.List(
         fields.Pluck('EmployeeViewSchema', 'id'),
         required=True,
-        metadata={'example': '[1]'},
-        description='Lista dos funcionários que executam o serviço',
+        metadata=ID_LIST_METADATA,
+        description=EMPLOYEES_DESCRIPTION,
     )
     appointments = fields.List(
         fields.Pluck('AppointmentViewSchema', 'id'),
         required=True,
-        metadata={'example': '[1]'},
-        description='Lista dos agendamentos que possuem o serviço',
+        metadata=ID_LIST_METADATA,
+        description=APPOINTMENTS_DESCRIPTION,
     )
@@ -0,0 +1,41 @@
+"""
+Validators module shared by the schemas.
+"""
+
+from typing import Any, Iterable, Optional
+from marshmallow import ValidationError, validate
+
+
+class FrozenOneOf(validate.OneOf):
+    """
+    OneOf validator backed by a frozenset for constant-time membership checks.
+
+    The ordered `choices` are kept as given so error messages and the
+    generated OpenAPI enum stay stable.
+    """
+
+    def __init__(self, choices: Iterable, labels: Optional[Iterable[str]] = None,
+                 *, error: Optional[str] = None) -> None:
+        super().__init__(choices, labels, error=error)
+        self._choices_set = frozenset(self.choices)
+
+    def __call__(self, value: Any) -> Any:
+        """
+        Validate that the value is one of the choices.
+
+        Args:
+            value (Any): The value to validate.
+
+        Returns:
+            Any: The validated value.
+
+        Raises:
+            ValidationError: If the value is not one of the choices.
+        """
+        try:
+            if value not in self._choices_set:
+                raise ValidationError(self._format_error(value))
+        except TypeError as error:
+            raise ValidationError(self._format_error(value)) from error
+
+        return value
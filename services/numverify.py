@@ -2,9 +2,28 @@
 Service module for phone number validation.
 """
 
+from threading import Lock
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from settings import API_KEY, URL, PRETTIFY_JSON_RESPONSE
 
+CACHE_MAX_SIZE = 10000
+CACHE_TTL = 24 * 60 * 60
+POOL_SIZE = 10
+
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.1)
+))
+
+_validation_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL)
+_validation_cache_lock = Lock()
+
 
 class NumVerify:
     """
@@ -27,15 +46,20 @@ class NumVerify:
             params (object): A dictionary of query parameters to include
                            in the API request.
 
+        NumVerify reports API errors (bad access key, usage or rate limits)
+        with a 200 status and a `{"success": false, "error": {...}}` body;
+        those are treated as failed requests too.
+
         Returns:
             dict: The parsed JSON response from the API if the
                          HTTP request succeeds (status 200).
 
         Raises:
-            requests.HTTPError: If the API returns a non-200 status code.
+            requests.HTTPError: If the API returns a non-200 status code or
+                an error body.
         """
 
-        response = requests.get(URL, params=params, timeout=10)
+        response = _session.get(URL, params=params, timeout=10)
 
         try:
             response.raise_for_status()
@@ -44,24 +68,55 @@ class NumVerify:
                 f"NumVerify API request failed: {response.status_code} - {response.text}"
             ) from exc
 
-        return response.json()
+        result = orjson.loads(response.content)
+
+        if result.get('success') is False or 'valid' not in result:
+            raise requests.HTTPError(
+                f"NumVerify API request failed: {result.get('error', result)}"
+            )
+
+        return result
 
     @staticmethod
-    def validate_phone_number(phone_number: str) -> dict:
+    def _normalize_phone_number(phone_number: str) -> str:
         """
-        Validate a phone number using the NumVerify API.
+        Normalize a Brazilian phone number to its national digits.
 
-        This method formats the required query parameters and delegates
-        the API call to `_get_number_validation`.
+        Args:
+            phone_number (str): The phone number, with or without the +55 prefix.
+
+        Returns:
+            str: The phone number without the '+' sign and the 55 country code.
+        """
+
+        digits = phone_number.lstrip('+')
+        if len(digits) > 11 and digits.startswith('55'):
+            digits = digits[2:]
+
+        return digits
+
+    @staticmethod
+    def _cached_validation(phone_number: str) -> dict:
+        """
+        Validate a normalized phone number, caching successful responses.
+
+        Results are kept for `CACHE_TTL` seconds. Failed requests raise
+        from `_get_number_validation` and are never cached.
 
         Args:
-            phone_number (str): The phone number to validate. It should
-                                be a numeric string.
+            phone_number (str): The normalized phone number.
 
         Returns:
             dict: The validation result returned by the NumVerify API.
+
+        Raises:
+            requests.HTTPError: If the API request fails.
         """
 
+        with _validation_cache_lock:
+            if phone_number in _validation_cache:
+                return _validation_cache[phone_number]
+
         params = {
             "access_key": API_KEY,
             "number": phone_number,
@@ -69,4 +124,27 @@ class NumVerify:
             "country_code": 'BR'
         }
 
-        return NumVerify._get_number_validation(params)
+        result = NumVerify._get_number_validation(params)
+
+        with _validation_cache_lock:
+            _validation_cache[phone_number] = result
+
+        return result
+
+    @staticmethod
+    def validate_phone_number(phone_number: str) -> dict:
+        """
+        Validate a phone number using the NumVerify API.
+
+        The number is normalized so that `+5521...` and `21...` share the same
+        cached result; only cache misses reach the API.
+
+        Args:
+            phone_number (str): The phone number to validate. It should
+                                be a numeric string.
+
+        Returns:
+            dict: The validation result returned by the NumVerify API.
+        """
+
+        return NumVerify._cached_validation(NumVerify._normalize_phone_number(phone_number))
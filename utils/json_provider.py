@@ -0,0 +1,58 @@
+"""
+JSON provider module for the Flask application.
+"""
+
+from typing import Any
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider that serializes and parses data using orjson.
+
+    Types not natively handled by orjson (and datetimes, to keep the
+    HTTP date format) fall back to Flask's default serializer.
+
+    Unlike Flask's default provider, output is raw UTF-8 rather than
+    ASCII-escaped (`ensure_ascii` is not supported) and responses are
+    never pretty-printed in debug mode (`compact` is not supported).
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj (Any): The data to serialize.
+            **kwargs: `sort_keys` (defaults to True) and `indent` (any truthy
+                value indents with two spaces). Other arguments are ignored.
+
+        Returns:
+            str: The JSON document.
+        """
+        option = ORJSON_OPTIONS
+
+        if kwargs.get('sort_keys', True):
+            option |= orjson.OPT_SORT_KEYS
+
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                            option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data from JSON.
+
+        Args:
+            s (str | bytes): The JSON document.
+            **kwargs: Ignored, kept for compatibility with the provider interface.
+
+        Returns:
+            Any: The parsed data.
+        """
+        return orjson.loads(s)
@@ -0,0 +1,70 @@
+"""
+Process-local cache module for repository lookups.
+"""
+
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterable
+from cachetools import TTLCache
+
+
+class LookupCache:
+    """
+    Thread-safe TTL cache for lookup results.
+
+    Results (including None for "not found") are kept for `ttl` seconds or
+    until invalidated. Callers must invalidate keys whenever a write could
+    change their result. A result loaded while an invalidation happened is
+    returned but not stored, as it may predate the write.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+        self._generation = 0
+
+    def get(self, key: Hashable, loader: Callable[[Hashable], Any]) -> Any:
+        """
+        Return the cached result for a key, loading it on a miss.
+
+        Args:
+            key (Hashable): The lookup key.
+            loader (Callable[[Hashable], Any]): Function computing the result for the key.
+
+        Returns:
+            Any: The cached or freshly loaded result.
+        """
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+            generation = self._generation
+
+        value = loader(key)
+
+        with self._lock:
+            if generation == self._generation:
+                self._cache[key] = value
+
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop a key from the cache.
+
+        Args:
+            key (Hashable): The key to drop.
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.pop(key, None)
+
+    def invalidate_many(self, keys: Iterable[Hashable]) -> None:
+        """
+        Drop several keys from the cache, acquiring the lock once.
+
+        Args:
+            keys (Iterable[Hashable]): The keys to drop.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._cache.pop(key, None)
@@ -0,0 +1,25 @@
+"""
+Request-scoped values module.
+"""
+
+from datetime import datetime
+from flask import g, has_app_context
+
+
+def request_now() -> datetime:
+    """
+    Return the current local time, fixed for the duration of the current request.
+
+    Outside an application context the current time is returned directly.
+
+    Returns:
+        datetime: The time of the first call within the current request.
+    """
+
+    if not has_app_context():
+        return datetime.now()
+
+    if 'request_now' not in g:
+        g.request_now = datetime.now()
+
+    return g.request_now
@@ -2,25 +2,122 @@
 Validation module for Appointment entities.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, time
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from repositories.employee_repository import get_employee
-from repositories.customer_repository import get_customer
-from repositories.service_repository import get_service
+from repositories.service_repository import get_services_by_services_ids
 from repositories.appointment_repository import (
-    get_customer_appointment,
-    get_employee_appointment
+    get_appointment_preflight,
+    get_conflicting_appointments
 )
-from validations.base import BaseValidation
+from utils.request_cache import request_now
+from validations.base import BaseValidation, build_errors, is_of_type
+
+if TYPE_CHECKING:
+    from database.models.service import Service
 
 MAX_ADVANCE_DAYS = 7
+MAX_ADVANCE_DELTA = timedelta(days=MAX_ADVANCE_DAYS)
 OPENING_TIME = time(9, 0)
 CLOSING_TIME = time(18, 0)
 
+DATE_RANGE_ERRORS = build_errors(
+    f'Date must be between now and {MAX_ADVANCE_DAYS} days in advance.', 'date')
+BUSINESS_HOURS_ERRORS = build_errors(
+    f'Appointments must be between {OPENING_TIME.strftime("%H:%M")} '
+    f'and {CLOSING_TIME.strftime("%H:%M")}.', 'date')
+
+ISO_DATETIME_CACHE_SIZE = 1024
+
 ALLOWED_UPDATE_FIELDS = {'date': datetime,
                          'employee_id': int, 'services_ids': list}
 
 
+@lru_cache(maxsize=ISO_DATETIME_CACHE_SIZE)
+def _parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO formatted string, caching the result.
+
+    Args:
+        value (str): The ISO formatted string.
+
+    Returns:
+        datetime: The parsed datetime.
+
+    Raises:
+        ValueError: If the string is not a valid ISO datetime.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _parse_datetime(value: Any, field: str) -> datetime:
+    """
+    Parse an update value into a datetime.
+
+    Args:
+        value (Any): A datetime or an ISO formatted string.
+        field (str): The field name for error messages.
+
+    Returns:
+        datetime: The parsed datetime.
+
+    Raises:
+        HTTPException: If value is not a datetime nor a valid ISO string (400).
+    """
+    if isinstance(value, datetime):
+        return value
+
+    if isinstance(value, str):
+        try:
+            return _parse_iso_datetime(value)
+        except ValueError:
+            BaseValidation.abort_with_error(
+                400, f"Field '{field}' must be a valid ISO datetime string.", field)
+
+    BaseValidation.abort_with_error(
+        400, f"Field '{field}' must be a datetime or ISO string.", field)
+
+
+def _type_parser(expected_type: type) -> Callable[[Any, str], Any]:
+    """
+    Build a parser that only checks the value against the expected type.
+
+    Args:
+        expected_type (type): The type the value must be an instance of.
+
+    Returns:
+        Callable[[Any, str], Any]: Parser returning the value unchanged.
+    """
+    def parse(value: Any, field: str) -> Any:
+        """Return the value unchanged if it has the expected type."""
+        if not is_of_type(value, expected_type):
+            BaseValidation.abort_with_error(
+                400, f"Field '{field}' must be of type {expected_type.__name__}.", field)
+        return value
+
+    return parse
+
+
+_UPDATE_FIELD_PARSERS = {
+    field: _parse_datetime if expected_type is datetime else _type_parser(expected_type)
+    for field, expected_type in ALLOWED_UPDATE_FIELDS.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ValidatedAppointment:
+    """
+    Entities resolved while validating a new appointment.
+
+    Attributes:
+        services (list[Service]): The services of the appointment.
+    """
+
+    services: list['Service']
+
+
 class AppointmentValidation:
     """
     Validation class for Appointment entities.
@@ -40,12 +137,11 @@ class AppointmentValidation:
         Raises:
             HTTPException: If date is outside allowed range (400).
         """
-        now = datetime.now()
-        max_date = now + timedelta(days=MAX_ADVANCE_DAYS)
+        now = request_now()
+        max_date = now + MAX_ADVANCE_DELTA
 
         if not now <= date <= max_date:
-            BaseValidation.abort_with_error(
-                400, f'Date must be between now and {MAX_ADVANCE_DAYS} days in advance.', 'date')
+            BaseValidation.abort_with_errors(400, DATE_RANGE_ERRORS)
 
     @staticmethod
     def _validate_business_hours(date: datetime) -> None:
@@ -59,13 +155,10 @@ class AppointmentValidation:
             HTTPException: If time is outside business hours (400).
         """
         if not OPENING_TIME <= date.time() < CLOSING_TIME:
-            opening = OPENING_TIME.strftime('%H:%M')
-            closing = CLOSING_TIME.strftime('%H:%M')
-            BaseValidation.abort_with_error(
-                400, f'Appointments must be between {opening} and {closing}.', 'date')
+            BaseValidation.abort_with_errors(400, BUSINESS_HOURS_ERRORS)
 
     @staticmethod
-    def _validate_date_available(
+    def validate_date_available(
         date: datetime,
         employee_id: int,
         customer_id: int,
@@ -83,11 +176,14 @@ class AppointmentValidation:
         Raises:
             HTTPException: If the time slot is already booked (409).
         """
-        if get_customer_appointment(date, customer_id, exclude_appointment_id):
+        conflicts = get_conflicting_appointments(
+            date, customer_id, employee_id, exclude_appointment_id)
+
+        if any(appointment.customer_id == customer_id for appointment in conflicts):
             BaseValidation.abort_with_error(
                 409, 'Customer already has an appointment at this time.', 'date')
 
-        if get_employee_appointment(date, employee_id, exclude_appointment_id):
+        if conflicts:
             BaseValidation.abort_with_error(
                 409, 'Employee already has an appointment at this time.', 'date')
 
@@ -96,6 +192,8 @@ class AppointmentValidation:
         """
         Validate and retrieve Service objects for the given IDs.
 
+        Duplicate IDs are only looked up and returned once.
+
         Args:
             service_ids (list[int]): List of service IDs to validate.
 
@@ -109,15 +207,15 @@ class AppointmentValidation:
             BaseValidation.abort_with_error(
                 400, 'At least one service is required.', 'service_ids')
 
-        services = []
-        for service_id in service_ids:
-            service = get_service(service_id)
-            if service is None:
+        unique_ids = list(dict.fromkeys(service_ids))
+        found = {service.id: service for service in get_services_by_services_ids(unique_ids)}
+
+        for service_id in unique_ids:
+            if service_id not in found:
                 BaseValidation.abort_with_error(
                     404, f'Service with ID {service_id} not found.', 'service_ids')
-            services.append(service)
 
-        return services
+        return [found[service_id] for service_id in unique_ids]
 
     @staticmethod
     def _get_validated_employee(employee_id: int) -> object:
@@ -140,34 +238,13 @@ class AppointmentValidation:
 
         return employee
 
-    @staticmethod
-    def _get_validated_customer(customer_id: int) -> object:
-        """
-        Validate and retrieve the Customer object.
-
-        Args:
-            customer_id (int): The customer's ID.
-
-        Returns:
-            object: The Customer object.
-
-        Raises:
-            HTTPException: If customer is not found (404).
-        """
-        customer = get_customer(customer_id)
-        if customer is None:
-            BaseValidation.abort_with_error(
-                404, f'Customer with ID {customer_id} not found.', 'customer_id')
-
-        return customer
-
     @staticmethod
     def validate_appointment(
         date: datetime,
         customer_id: int,
         employee_id: int,
         service_ids: list[int]
-    ) -> dict:
+    ) -> ValidatedAppointment:
         """
         Validate a new appointment's data.
 
@@ -178,28 +255,35 @@ class AppointmentValidation:
             service_ids (list[int]): List of service IDs for the appointment.
 
         Returns:
-            dict: Dictionary containing validated entities:
-                - customer: The Customer object
-                - employee: The Employee object
-                - services: List of Service objects
+            ValidatedAppointment: The validated services.
 
         Raises:
             HTTPException: If any validation fails (400, 404, or 409).
         """
-        customer = AppointmentValidation._get_validated_customer(customer_id)
-        employee = AppointmentValidation._get_validated_employee(employee_id)
-        services = AppointmentValidation._get_validated_services(service_ids)
-
         AppointmentValidation._validate_date_range(date)
         AppointmentValidation._validate_business_hours(date)
-        AppointmentValidation._validate_date_available(
-            date, employee_id, customer_id)
 
-        return {
-            'customer': customer,
-            'employee': employee,
-            'services': services
-        }
+        preflight = get_appointment_preflight(date, customer_id, employee_id)
+
+        if not preflight.customer_exists:
+            BaseValidation.abort_with_error(
+                404, f'Customer with ID {customer_id} not found.', 'customer_id')
+
+        if not preflight.employee_exists:
+            BaseValidation.abort_with_error(
+                404, f'Employee with ID {employee_id} not found.', 'employee_id')
+
+        services = AppointmentValidation._get_validated_services(service_ids)
+
+        if preflight.customer_conflict:
+            BaseValidation.abort_with_error(
+                409, 'Customer already has an appointment at this time.', 'date')
+
+        if preflight.employee_conflict:
+            BaseValidation.abort_with_error(
+                409, 'Employee already has an appointment at this time.', 'date')
+
+        return ValidatedAppointment(services)
 
     @staticmethod
     def _validate_update_payload(payload: dict) -> dict:
@@ -217,28 +301,12 @@ class AppointmentValidation:
         """
         cleaned = {}
 
-        for field, expected_type in ALLOWED_UPDATE_FIELDS.items():
-            value = payload.get(field)
-            if value is None:
+        for field, value in payload.items():
+            parse = _UPDATE_FIELD_PARSERS.get(field)
+            if parse is None or value is None:
                 continue
 
-            if expected_type == datetime:
-                if isinstance(value, datetime):
-                    cleaned[field] = value
-                elif isinstance(value, str):
-                    try:
-                        cleaned[field] = datetime.fromisoformat(value)
-                    except ValueError:
-                        BaseValidation.abort_with_error(
-                            400, f"Field '{field}' must be a valid ISO datetime string.", field)
-                else:
-                    BaseValidation.abort_with_error(
-                        400, f"Field '{field}' must be a datetime or ISO string.", field)
-            elif not isinstance(value, expected_type):
-                BaseValidation.abort_with_error(
-                    400, f"Field '{field}' must be of type {expected_type.__name__}.", field)
-            else:
-                cleaned[field] = value
+            cleaned[field] = parse(value, field)
 
         if not cleaned:
             BaseValidation.abort_with_error(
@@ -252,7 +320,8 @@ class AppointmentValidation:
         current_customer_id: int,
         current_employee_id: Optional[int] = None,
         current_date: Optional[datetime] = None,
-        appointment_id: Optional[int] = None
+        appointment_id: Optional[int] = None,
+        current_services_ids: Optional[list[int]] = None
     ) -> dict:
         """
         Validate update payload and check constraints.
@@ -263,6 +332,8 @@ class AppointmentValidation:
             current_employee_id (Optional[int]): Current employee ID (for availability check).
             current_date (Optional[datetime]): Current appointment date (for availability check).
             appointment_id (Optional[int]): ID of the appointment being updated.
+            current_services_ids (Optional[list[int]]): Current service IDs. Unchanged
+                employee or services are not fetched again.
 
         Returns:
             dict: Cleaned fields with validated entities ready to apply:
@@ -276,6 +347,17 @@ class AppointmentValidation:
         cleaned = AppointmentValidation._validate_update_payload(fields)
         result = {}
 
+        if 'date' in cleaned:
+            AppointmentValidation._validate_date_range(cleaned['date'])
+            AppointmentValidation._validate_business_hours(cleaned['date'])
+
+        if 'employee_id' in cleaned and cleaned['employee_id'] == current_employee_id:
+            del cleaned['employee_id']
+
+        if ('services_ids' in cleaned and current_services_ids is not None
+                and frozenset(cleaned['services_ids']) == frozenset(current_services_ids)):
+            del cleaned['services_ids']
+
         if 'employee_id' in cleaned:
             result['employee'] = AppointmentValidation._get_validated_employee(
                 cleaned['employee_id']
@@ -291,14 +373,12 @@ class AppointmentValidation:
 
         if 'date' in cleaned:
             date = cleaned['date']
-            AppointmentValidation._validate_date_range(date)
-            AppointmentValidation._validate_business_hours(date)
-            AppointmentValidation._validate_date_available(
+            AppointmentValidation.validate_date_available(
                 date, employee_id, current_customer_id, appointment_id
             )
             result['date'] = date
         elif employee_id != current_employee_id and current_date:
-            AppointmentValidation._validate_date_available(
+            AppointmentValidation.validate_date_available(
                 current_date, employee_id, current_customer_id, appointment_id
             )
 
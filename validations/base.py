@@ -2,10 +2,60 @@
 Validation module for all entities.
 """
 
-from typing import Any
+import re
+from typing import Any, Callable, NoReturn
 from flask_smorest import abort
 from services.numverify import NumVerify
 
+BR_PHONE_NUMBER_RE = re.compile(r'(?:\+?55)?[1-9][0-9]9[0-9]{8}')
+
+
+def build_errors(message: str, field: str = 'json') -> dict:
+    """
+    Build the error envelope sent in validation error responses.
+
+    Args:
+        message (str): The error message to display.
+        field (str): The field name for error categorization. Defaults to 'json'.
+
+    Returns:
+        dict: The errors payload, keyed by location and field.
+    """
+    return {'json': {field: [message]}}
+
+
+TYPE_VALIDATORS: dict[type, Callable[[Any], bool]] = {
+    int: lambda value: isinstance(value, int) and not isinstance(value, bool),
+    str: lambda value: isinstance(value, str),
+    list: lambda value: isinstance(value, list),
+}
+
+
+def is_of_type(value: Any, expected_type: type) -> bool:
+    """
+    Check a payload value against its expected type.
+
+    Booleans are not accepted as integers.
+
+    Args:
+        value (Any): The value to check.
+        expected_type (type): The expected type.
+
+    Returns:
+        bool: True if the value has the expected type.
+    """
+    validator = TYPE_VALIDATORS.get(expected_type)
+    if validator is None:
+        return isinstance(value, expected_type)
+
+    return validator(value)
+
+
+EMAIL_CONFLICT_ERRORS = build_errors('Email already registered.', 'email')
+PHONE_NUMBER_CONFLICT_ERRORS = build_errors('Phone number already registered.', 'phone_number')
+INVALID_PHONE_NUMBER_ERRORS = build_errors(
+    'The provided phone number is invalid.', 'phone_number')
+
 
 class BaseValidation:
     """
@@ -17,7 +67,7 @@ class BaseValidation:
     """
 
     @staticmethod
-    def abort_with_error(status_code: int, message: str, field: str = 'json') -> None:
+    def abort_with_error(status_code: int, message: str, field: str = 'json') -> NoReturn:
         """
         Abort with a status code error.
 
@@ -29,7 +79,24 @@ class BaseValidation:
         Raises:
             HTTPException: Always raises with the specified status code.
         """
-        abort(status_code, errors={'json': {field: [message]}})
+        BaseValidation.abort_with_errors(status_code, build_errors(message, field))
+
+    @staticmethod
+    def abort_with_errors(status_code: int, errors: dict) -> NoReturn:
+        """
+        Abort with a status code error using a prebuilt errors payload.
+
+        The payload is only read, so module-level constants can be shared
+        across requests.
+
+        Args:
+            status_code (int): The HTTP status code.
+            errors (dict): The errors payload, as returned by `build_errors`.
+
+        Raises:
+            HTTPException: Always raises with the specified status code.
+        """
+        abort(status_code, errors=errors)
 
     @staticmethod
     def validate_positive_int(value: Any, name: str = 'id') -> None:
@@ -54,8 +121,7 @@ class BaseValidation:
         Raises:
             HTTPException: Always raises a 409 Conflict.
         """
-        BaseValidation.abort_with_error(
-            409, 'Email already registered.', 'email')
+        BaseValidation.abort_with_errors(409, EMAIL_CONFLICT_ERRORS)
 
     @staticmethod
     def abort_phone_number_conflict() -> None:
@@ -65,8 +131,7 @@ class BaseValidation:
         Raises:
             HTTPException: Always raises a 409 Conflict.
         """
-        BaseValidation.abort_with_error(
-            409, 'Phone number already registered.', 'phone_number')
+        BaseValidation.abort_with_errors(409, PHONE_NUMBER_CONFLICT_ERRORS)
 
     @staticmethod
     def abort_invalid_phone_number() -> None:
@@ -76,8 +141,7 @@ class BaseValidation:
         Raises:
             HTTPException: Always raises a 400 Bad Request.
         """
-        BaseValidation.abort_with_error(
-            400, 'The provided phone number is invalid.', 'phone_number')
+        BaseValidation.abort_with_errors(400, INVALID_PHONE_NUMBER_ERRORS)
 
     @staticmethod
     def validate_update_payload(payload: dict, allowed_update_fields: dict[str, type]) -> dict:
@@ -96,11 +160,11 @@ class BaseValidation:
         """
         cleaned = {}
 
-        for field, expected_type in allowed_update_fields.items():
-            value = payload.get(field)
-            if value is None:
+        for field, value in payload.items():
+            expected_type = allowed_update_fields.get(field)
+            if expected_type is None or value is None:
                 continue
-            if not isinstance(value, expected_type):
+            if not is_of_type(value, expected_type):
                 BaseValidation.abort_with_error(
                     400, f"Field '{field}' must be of type {expected_type.__name__}.", field)
             cleaned[field] = value
@@ -112,25 +176,20 @@ class BaseValidation:
         return cleaned
 
     @staticmethod
-    def _phone_number_pre_validation(phone_number: str) -> None:
-        if not isinstance(phone_number, str):
-            BaseValidation.abort_invalid_phone_number()
-
-        allowed = phone_number.startswith("+55") and phone_number[3:].isdigit()
-        only_digits = phone_number.isdigit()
-
-        if not (allowed or only_digits):
-            BaseValidation.abort_invalid_phone_number()
+    def validate_phone_number_format(phone_number: str) -> None:
+        """
+        Validate the format of a Brazilian mobile phone number.
 
-        digits = phone_number.lstrip("+")
-        if digits.startswith("55"):
-            digits = digits[2:]
+        Accepts an optional `55`/`+55` country code followed by a two-digit
+        area code (10-99) and a nine-digit mobile number starting with 9.
 
-        if len(digits) != 11:
-            BaseValidation.abort_invalid_phone_number()
+        Args:
+            phone_number (str): The phone number to validate.
 
-        ddd = digits[:2]
-        if not (ddd.isdigit() and 10 <= int(ddd) <= 99):
+        Raises:
+            HTTPException: If the phone number is malformed (400).
+        """
+        if not isinstance(phone_number, str) or BR_PHONE_NUMBER_RE.fullmatch(phone_number) is None:
             BaseValidation.abort_invalid_phone_number()
 
     @staticmethod
@@ -157,7 +216,23 @@ class BaseValidation:
             CustomValidationError: Triggered when the number does not meet requirements.
         """
 
-        BaseValidation._phone_number_pre_validation(phone_number)
+        BaseValidation.validate_phone_number_format(phone_number)
+        BaseValidation.verify_phone_number(phone_number)
+
+    @staticmethod
+    def verify_phone_number(phone_number: str) -> None:
+        """
+        Verify a well-formed Brazilian mobile phone number with the NumVerify API.
+
+        Callers must have checked the format with `validate_phone_number_format`.
+
+        Args:
+            phone_number (str): The phone number to verify.
+
+        Raises:
+            HTTPError: If the external API request fails.
+            HTTPException: If the number is not a valid Brazilian mobile number (400).
+        """
 
         response = NumVerify.validate_phone_number(phone_number)
 
@@ -2,13 +2,10 @@
 Validation module for Customer entities.
 """
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional
 from validations.base import BaseValidation
-from repositories.customer_repository import search_customer_by_email, \
-    search_customer_by_phone_number
-
-if TYPE_CHECKING:
-    from ..database.models.customer import Customer
+from repositories.customer_repository import get_customer_id_by_email, \
+    get_customer_id_by_phone_number
 
 ALLOWED_UPDATE_FIELDS = {'name': str, 'email': str, 'phone_number': str}
 
@@ -19,7 +16,7 @@ class CustomerValidation:
     """
 
     @staticmethod
-    def _find_customer_by_email(email: str) -> Optional['Customer']:
+    def _find_customer_id_by_email(email: str) -> Optional[int]:
         """
         Searches for the given email in the Customer database.
 
@@ -27,13 +24,13 @@ class CustomerValidation:
             email (str): The email to search for.
 
         Returns:
-            Optional[Customer]: The customer object if found, otherwise None.
+            Optional[int]: The customer's ID if found, otherwise None.
         """
 
-        return search_customer_by_email(email)
+        return get_customer_id_by_email(email)
 
     @staticmethod
-    def _find_customer_by_phone_number(phone_number: str) -> Optional['Customer']:
+    def _find_customer_id_by_phone_number(phone_number: str) -> Optional[int]:
         """
         Searches for the given phone number in the Customer database.
 
@@ -41,10 +38,10 @@ class CustomerValidation:
             phone_number (str): The phone number to search for.
 
         Returns:
-            Optional[Customer]: The customer object if found, otherwise None.
+            Optional[int]: The customer's ID if found, otherwise None.
         """
 
-        return search_customer_by_phone_number(phone_number)
+        return get_customer_id_by_phone_number(phone_number)
 
     @staticmethod
     def validate_customer(email: str, phone_number: str) -> None:
@@ -58,13 +55,15 @@ class CustomerValidation:
             HTTPException: If any validation fails.
         """
 
-        if CustomerValidation._find_customer_by_email(email) is not None:
+        BaseValidation.validate_phone_number_format(phone_number)
+
+        if CustomerValidation._find_customer_id_by_email(email) is not None:
             BaseValidation.abort_email_conflict()
 
-        if CustomerValidation._find_customer_by_phone_number(phone_number) is not None:
+        if CustomerValidation._find_customer_id_by_phone_number(phone_number) is not None:
             BaseValidation.abort_phone_number_conflict()
 
-        BaseValidation.validate_brazilian_phone_number(phone_number)
+        BaseValidation.verify_phone_number(phone_number)
 
     @staticmethod
     def validate_customer_update(
@@ -83,29 +82,27 @@ class CustomerValidation:
             dict: Cleaned fields ready to apply.
 
         Raises:
-            HTTPException: For uniqueness conflicts (409).
+            HTTPException: For uniqueness conflicts (409) or invalid phone number (400).
         """
         cleaned = BaseValidation.validate_update_payload(
             fields, allowed_update_fields=ALLOWED_UPDATE_FIELDS)
 
         if 'email' in cleaned:
-            existing = CustomerValidation._find_customer_by_email(cleaned['email'])
+            existing_id = CustomerValidation._find_customer_id_by_email(cleaned['email'])
             is_conflict = (
-                existing is not None
-                and (current_customer_id is None or
-                     getattr(existing, 'id', None) != current_customer_id))
+                existing_id is not None
+                and (current_customer_id is None or existing_id != current_customer_id))
 
             if is_conflict:
                 BaseValidation.abort_email_conflict()
 
         if 'phone_number' in cleaned:
-            existing = CustomerValidation._find_customer_by_phone_number(cleaned['phone_number'])
-            is_conflict = (
-                existing is not None
-                and (current_customer_id is None or
-                     getattr(existing, 'id', None) != current_customer_id))
+            existing_id = CustomerValidation._find_customer_id_by_phone_number(
+                cleaned['phone_number'])
 
-            if is_conflict:
+            if existing_id is None:
+                BaseValidation.validate_brazilian_phone_number(cleaned['phone_number'])
+            elif current_customer_id is None or existing_id != current_customer_id:
                 BaseValidation.abort_phone_number_conflict()
 
         return cleaned
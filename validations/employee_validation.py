@@ -3,18 +3,22 @@ Validation module for Employee entities.
 """
 
 from typing import Optional, TYPE_CHECKING
-from repositories.service_repository import get_services_count, get_service
-from repositories.employee_repository import search_employee_email, search_employee_by_phone_number
+from repositories.service_repository import get_services_by_services_ids
+from repositories.employee_repository import get_employee_id_by_email, \
+    get_employee_id_by_phone_number, preflight_employee_validation, \
+    search_employee_ids_by_email_or_phone_number
 from validations.base import BaseValidation
 
 if TYPE_CHECKING:
-    from ..database.models.employee import Employee
+    from database.models.employee import Employee
 
-ALLOWED_STATUS_VALUES = ['available',
-                         'vacation', 'sick_leave', 'unavailable']
+STATUS_VALUES = ('available', 'vacation', 'sick_leave', 'unavailable')
+ALLOWED_STATUS_VALUES = frozenset(STATUS_VALUES)
+INVALID_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(STATUS_VALUES)}"
 
 ALLOWED_UPDATE_FIELDS = {'name': str, 'email': str,
                          'phone_number': str, 'status': str, 'service_ids': list}
+VALIDATED_UPDATE_FIELDS = frozenset({'email', 'phone_number', 'service_ids', 'status'})
 
 
 class EmployeeValidation:
@@ -26,7 +30,7 @@ class EmployeeValidation:
     """
 
     @staticmethod
-    def _find_employee_by_email(email: str) -> Optional['Employee']:
+    def _find_employee_id_by_email(email: str) -> Optional[int]:
         """
         Search for an employee by email.
 
@@ -34,12 +38,12 @@ class EmployeeValidation:
             email (str): The email to search for.
 
         Returns:
-            Optional[Employee]: The employee object if found, otherwise None.
+            Optional[int]: The employee's ID if found, otherwise None.
         """
-        return search_employee_email(email)
+        return get_employee_id_by_email(email)
 
     @staticmethod
-    def _find_employee_by_phone_number(phone_number: str) -> Optional['Employee']:
+    def _find_employee_id_by_phone_number(phone_number: str) -> Optional[int]:
         """
         Searches for the given phone number in the employee database.
 
@@ -47,33 +51,48 @@ class EmployeeValidation:
             phone_number (str): The phone number to search for.
 
         Returns:
-            Optional[Employee]: The employee object if found, otherwise None.
+            Optional[int]: The employee's ID if found, otherwise None.
         """
 
-        return search_employee_by_phone_number(phone_number)
+        return get_employee_id_by_phone_number(phone_number)
 
     @staticmethod
-    def _validate_services_exist() -> None:
+    def _find_employee_ids_by_email_or_phone_number(
+        email: str,
+        phone_number: str
+    ) -> tuple[Optional[int], Optional[int]]:
         """
-        Ensure at least one service exists in the system.
+        Search for the employees owning an email and a phone number in one query.
 
-        Raises:
-            HTTPException: If no services are registered (422).
+        Args:
+            email (str): The email to search for.
+            phone_number (str): The phone number to search for.
+
+        Returns:
+            tuple[Optional[int], Optional[int]]: The IDs of the employees owning the
+                email and the phone number, or None where not registered.
         """
-        if get_services_count() == 0:
-            BaseValidation.abort_with_error(
-                422, 'A service must be registered before registering an employee.', 'service')
+        email_id = phone_number_id = None
+
+        for employee in search_employee_ids_by_email_or_phone_number(email, phone_number):
+            if employee.email == email:
+                email_id = employee.id
+            if employee.phone_number == phone_number:
+                phone_number_id = employee.id
+
+        return email_id, phone_number_id
 
     @staticmethod
-    def _get_validated_services(service_ids: list[int]) -> list:
+    def _match_services(service_ids: list[int], services: list) -> list:
         """
-        Validate and retrieve Service objects for the given IDs.
+        Check that every requested service ID was found.
 
         Args:
-            service_ids (list[int]): List of service IDs to validate.
+            service_ids (list[int]): Deduplicated list of service IDs to validate.
+            services (list): Service objects found for those IDs.
 
         Returns:
-            list: List of Service objects.
+            list: List of Service objects, in the requested order.
 
         Raises:
             HTTPException: If any service is not found (404).
@@ -82,37 +101,34 @@ class EmployeeValidation:
             BaseValidation.abort_with_error(
                 404, 'Service not found.', 'service')
 
-        services = []
+        found = {service.id: service for service in services}
+
         for service_id in service_ids:
-            service = get_service(service_id=service_id)
-            if service is None:
+            if service_id not in found:
                 BaseValidation.abort_with_error(
                     404, 'Service not found.', 'service')
 
-            services.append(service)
-
-        return services
+        return [found[service_id] for service_id in service_ids]
 
     @staticmethod
-    def _validate_email_unique(email: str, exclude_id: Optional[int] = None) -> None:
+    def _get_validated_services(service_ids: list[int]) -> list:
         """
-        Validate that an email is not already registered.
+        Validate and retrieve Service objects for the given IDs.
+
+        Duplicate IDs are only looked up and returned once.
 
         Args:
-            email (str): The email to check.
-            exclude_id (Optional[int]): Employee ID to exclude from the check.
+            service_ids (list[int]): List of service IDs to validate.
+
+        Returns:
+            list: List of Service objects.
 
         Raises:
-            HTTPException: If email is already registered (409).
+            HTTPException: If any service is not found (404).
         """
-        existing = EmployeeValidation._find_employee_by_email(email)
-        if existing is None:
-            return
-
-        if exclude_id is not None and getattr(existing, 'id', None) == exclude_id:
-            return
-
-        BaseValidation.abort_email_conflict()
+        unique_ids = list(dict.fromkeys(service_ids))
+        return EmployeeValidation._match_services(
+            unique_ids, get_services_by_services_ids(unique_ids))
 
     @staticmethod
     def validate_employee(email: str, service_ids: list[int], phone_number: str) -> list:
@@ -122,21 +138,32 @@ class EmployeeValidation:
         Args:
             email (str): The employee's email.
             service_ids (list[int]): List of service IDs to associate.
+            phone_number (str): The employee's phone number.
 
         Returns:
             list: List of validated Service objects.
 
         Raises:
-            HTTPException: If email is taken (409), no services exist (422),
-                or any service ID is invalid (404).
+            HTTPException: If email or phone number is taken (409), no services exist (422),
+                the phone number is invalid (400) or any service ID is invalid (404).
         """
-        EmployeeValidation._validate_email_unique(email)
-        EmployeeValidation._validate_services_exist()
-        if EmployeeValidation._find_employee_by_phone_number(phone_number) is not None:
+        BaseValidation.validate_phone_number_format(phone_number)
+
+        service_ids = list(dict.fromkeys(service_ids))
+        preflight = preflight_employee_validation(email, phone_number, service_ids)
+
+        if preflight.email_taken:
+            BaseValidation.abort_email_conflict()
+
+        if not preflight.has_services:
+            BaseValidation.abort_with_error(
+                422, 'A service must be registered before registering an employee.', 'service')
+
+        if preflight.phone_number_taken:
             BaseValidation.abort_phone_number_conflict()
 
-        BaseValidation.validate_brazilian_phone_number(phone_number)
-        return EmployeeValidation._get_validated_services(service_ids)
+        BaseValidation.verify_phone_number(phone_number)
+        return EmployeeValidation._match_services(service_ids, preflight.services)
 
     @staticmethod
     def _validate_status(status: str) -> None:
@@ -151,16 +178,13 @@ class EmployeeValidation:
         """
 
         if status not in ALLOWED_STATUS_VALUES:
-            BaseValidation.abort_with_error(
-                400,
-                f"Invalid status. Must be one of: {', '.join(ALLOWED_STATUS_VALUES)}",
-                'status'
-            )
+            BaseValidation.abort_with_error(400, INVALID_STATUS_ERROR, 'status')
 
     @staticmethod
     def validate_employee_update(
         fields: dict,
-        current_employee_id: Optional[int] = None
+        current_employee_id: Optional[int] = None,
+        current_employee: Optional['Employee'] = None
     ) -> dict:
         """
         Validate update payload and check uniqueness constraints.
@@ -169,39 +193,61 @@ class EmployeeValidation:
             fields (dict): Raw update payload.
             current_employee_id (Optional[int]): ID of the employee being updated. If provided,
                 allows the same email if it belongs to this employee.
+            current_employee (Optional[Employee]): The employee being updated. If provided,
+                an unchanged email or phone number is not looked up again.
 
         Returns:
             dict: Cleaned fields ready to apply.
 
         Raises:
-            HTTPException: For uniqueness conflicts (409) or invalid services (404).
+            HTTPException: For uniqueness conflicts (409), invalid phone number (400)
+                or invalid services (404).
         """
         cleaned = BaseValidation.validate_update_payload(
             fields, allowed_update_fields=ALLOWED_UPDATE_FIELDS
         )
 
-        if 'email' in cleaned:
-            EmployeeValidation._validate_email_unique(
-                cleaned['email'], exclude_id=current_employee_id
-            )
+        dirty = cleaned.keys() & VALIDATED_UPDATE_FIELDS
+
+        if current_employee is not None:
+            if cleaned.get('email') == current_employee.email:
+                dirty.discard('email')
+            if cleaned.get('phone_number') == current_employee.phone_number:
+                dirty.discard('phone_number')
+
+        if not dirty:
+            return cleaned
+
+        if 'status' in dirty:
+            EmployeeValidation._validate_status(cleaned['status'])
 
-        if 'phone_number' in cleaned:
-            existing = EmployeeValidation._find_employee_by_phone_number(
+        if 'phone_number' in dirty:
+            BaseValidation.validate_phone_number_format(cleaned['phone_number'])
+
+        email_id = phone_number_id = None
+
+        if 'email' in dirty and 'phone_number' in dirty:
+            email_id, phone_number_id = \
+                EmployeeValidation._find_employee_ids_by_email_or_phone_number(
+                    cleaned['email'], cleaned['phone_number'])
+        elif 'email' in dirty:
+            email_id = EmployeeValidation._find_employee_id_by_email(cleaned['email'])
+        elif 'phone_number' in dirty:
+            phone_number_id = EmployeeValidation._find_employee_id_by_phone_number(
                 cleaned['phone_number'])
-            is_conflict = (
-                existing is not None
-                and (current_employee_id is None or
-                     getattr(existing, 'id', None) != current_employee_id))
 
-            if is_conflict:
+        if email_id is not None and email_id != current_employee_id:
+            BaseValidation.abort_email_conflict()
+
+        if 'phone_number' in dirty:
+            if phone_number_id is None:
+                BaseValidation.verify_phone_number(cleaned['phone_number'])
+            elif current_employee_id is None or phone_number_id != current_employee_id:
                 BaseValidation.abort_phone_number_conflict()
 
-        if 'service_ids' in cleaned:
+        if 'service_ids' in dirty:
             cleaned['services'] = EmployeeValidation._get_validated_services(
                 cleaned.pop('service_ids')
             )
 
-        if 'status' in cleaned:
-            EmployeeValidation._validate_status(cleaned['status'])
-
         return cleaned
@@ -2,16 +2,16 @@
 Validation module for Service entities.
 """
 
-from typing import Optional, TYPE_CHECKING
-from repositories.service_repository import get_service_by_name
+from typing import Optional
+from repositories.service_repository import get_service_id_by_name
 from validations.base import BaseValidation
 
-if TYPE_CHECKING:
-    from ..database.models.service import Service
-
 MAX_SERVICE_PRICE = 10000
 MIN_SERVICE_PRICE = 2500
-ALLOWED_STATUS_VALUES = ['available', 'unavailable']
+PRICE_RANGE_ERROR = f'Price must be between {MIN_SERVICE_PRICE} and {MAX_SERVICE_PRICE} cents.'
+STATUS_VALUES = ('available', 'unavailable')
+ALLOWED_STATUS_VALUES = frozenset(STATUS_VALUES)
+INVALID_STATUS_ERROR = f'Status must be one of: {", ".join(STATUS_VALUES)}.'
 
 ALLOWED_UPDATE_FIELDS = {'name': str, 'price': int, 'status': str}
 
@@ -25,7 +25,7 @@ class ServiceValidation:
     """
 
     @staticmethod
-    def _find_service_by_name(name: str) -> Optional['Service']:
+    def _find_service_id_by_name(name: str) -> Optional[int]:
         """
         Search for a service by name.
 
@@ -33,10 +33,10 @@ class ServiceValidation:
             name (str): The service name to search for.
 
         Returns:
-            Optional[Service]: The service object if found, otherwise None.
+            Optional[int]: The service's ID if found, otherwise None.
         """
 
-        return get_service_by_name(name)
+        return get_service_id_by_name(name)
 
     @staticmethod
     def _validate_price_range(price: int) -> None:
@@ -50,9 +50,7 @@ class ServiceValidation:
             HTTPException: If price is outside valid range (422).
         """
         if not MIN_SERVICE_PRICE <= price <= MAX_SERVICE_PRICE:
-            BaseValidation.abort_with_error(
-                422,  f'Price must be between {MIN_SERVICE_PRICE} '
-                f'and {MAX_SERVICE_PRICE} cents.', 'price')
+            BaseValidation.abort_with_error(422, PRICE_RANGE_ERROR, 'price')
 
     @staticmethod
     def _validate_status(status: str) -> None:
@@ -66,8 +64,7 @@ class ServiceValidation:
             HTTPException: If status is not valid (422).
         """
         if status not in ALLOWED_STATUS_VALUES:
-            BaseValidation.abort_with_error(
-                422, f'Status must be one of: {", ".join(ALLOWED_STATUS_VALUES)}.', 'status')
+            BaseValidation.abort_with_error(422, INVALID_STATUS_ERROR, 'status')
 
     @staticmethod
     def _validate_name_unique(name: str, exclude_id: Optional[int] = None) -> None:
@@ -81,11 +78,11 @@ class ServiceValidation:
         Raises:
             HTTPException: If name is already registered (409).
         """
-        existing = ServiceValidation._find_service_by_name(name)
-        if existing is None:
+        existing_id = ServiceValidation._find_service_id_by_name(name)
+        if existing_id is None:
             return
 
-        if exclude_id is not None and getattr(existing, 'id', None) == exclude_id:
+        if exclude_id is not None and existing_id == exclude_id:
             return
 
         BaseValidation.abort_with_error(